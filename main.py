@@ -8,8 +8,6 @@ Supports both CLI and GUI modes
 
 import sys
 import argparse
-from src.core.tiktok_searcher import TikTokSearcher
-from src.managers.login_manager import TikTokSearchWithLogin
 from src.utils.utils import validate_query
 from src.core.config import MESSAGES
 
@@ -67,6 +65,10 @@ def run_cli_mode():
     print(f"\n🔍 Starting search for: {query}")
     print("🔐 Opening TikTok login page and waiting for your confirmation...")
     
+    # Imported here so GUI startup doesn't pay for selenium/openpyxl
+    from src.core.tiktok_searcher import TikTokSearcher
+    from src.managers.login_manager import TikTokSearchWithLogin
+    
     # Use enhanced searcher with automatic login management
     with TikTokSearchWithLogin() as enhanced_searcher:
         videos = enhanced_searcher.search_with_login(query, scroll_count)
@@ -194,6 +196,9 @@ def main():
                 print(f"🔍 Searching for: {query}")
                 print("🔐 Opening TikTok login page and waiting for your confirmation...")
                 
+                from src.core.tiktok_searcher import TikTokSearcher
+                from src.managers.login_manager import TikTokSearchWithLogin
+                
                 with TikTokSearchWithLogin() as enhanced_searcher:
                     videos = enhanced_searcher.search_with_login(query, scroll_count)
                     
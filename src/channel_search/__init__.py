@@ -1,10 +1,22 @@
 """
 Channel Search Module
 Handles TikTok channel-based video extraction and downloading
+
+ChannelExtractor and ChannelSearcher need selenium, so they are loaded on
+first access. Importing ChannelParser (as the GUI does) stays lightweight.
 """
 
 from .channel_parser import ChannelParser
-from .channel_extractor import ChannelExtractor
-from .channel_searcher import ChannelSearcher
 
 __all__ = ['ChannelParser', 'ChannelExtractor', 'ChannelSearcher']
+
+
+def __getattr__(name):
+    """Import the selenium-backed classes only when they are first used"""
+    if name == 'ChannelExtractor':
+        from .channel_extractor import ChannelExtractor
+        return ChannelExtractor
+    if name == 'ChannelSearcher':
+        from .channel_searcher import ChannelSearcher
+        return ChannelSearcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
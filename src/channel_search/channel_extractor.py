@@ -96,8 +96,14 @@ class ChannelExtractor:
             print(f"🌐 Navigating to channel: {channel_url}")
             self.driver.get(channel_url)
             
-            # Wait for page to load
-            time.sleep(3)
+            # Wait until the TikTok page is up rather than a fixed pause
+            try:
+                self.wait.until(EC.any_of(
+                    EC.title_contains("TikTok"),
+                    EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/@')]"))
+                ))
+            except TimeoutException:
+                print("⚠️  Page title not detected before timeout, continuing...")
             
             # Check if we're on the right page
             current_url = self.driver.current_url
@@ -130,17 +136,15 @@ class ChannelExtractor:
                 "//div[@data-e2e='user-post-item']"
             ]
             
-            for selector in video_selectors:
-                try:
-                    self.wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                    print("✅ Channel videos loaded successfully")
-                    return True
-                except TimeoutException:
-                    continue
-            
-            # If no specific selectors work, wait a bit more and continue
-            print("⚠️  Could not detect video elements, continuing anyway...")
-            time.sleep(5)
+            # One wait for whichever selector matches first (not one timeout per selector)
+            try:
+                self.wait.until(EC.any_of(*[
+                    EC.presence_of_element_located((By.XPATH, selector))
+                    for selector in video_selectors
+                ]))
+                print("✅ Channel videos loaded successfully")
+            except TimeoutException:
+                print("⚠️  Could not detect video elements, continuing anyway...")
             return True
             
         except Exception as e:
@@ -318,8 +322,11 @@ class ChannelExtractor:
             if not self._navigate_to_channel(channel_url):
                 return None
             
-            # Wait for page to load
-            time.sleep(3)
+            # Wait for the profile header instead of a fixed pause
+            try:
+                self.wait.until(EC.presence_of_element_located((By.XPATH, "//h1")))
+            except TimeoutException:
+                print("⚠️  Channel header not detected before timeout, continuing...")
             
             # Extract channel information
             channel_info = {
@@ -6,6 +6,22 @@ Handles parsing and validation of TikTok channel URLs and IDs
 import re
 from urllib.parse import urlparse, parse_qs
 
+# Compiled once at import; validation runs on every keystroke in the GUI
+_CHANNEL_PATTERNS = {
+    'username_url': re.compile(r'https?://(?:www\.)?tiktok\.com/@([^/?]+)'),
+    'username_direct': re.compile(r'^@?([a-zA-Z0-9._-]+)$'),
+    'short_url': re.compile(r'https?://vm\.tiktok\.com/([a-zA-Z0-9]+)'),
+    'mobile_url': re.compile(r'https?://m\.tiktok\.com/@([^/?]+)'),
+}
+_USERNAME_CHARS_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+_CONSECUTIVE_SPECIAL_RE = re.compile(r'[._-]{2,}')
+_TIKTOK_DOMAINS = frozenset({
+    'www.tiktok.com',
+    'tiktok.com',
+    'vm.tiktok.com',
+    'm.tiktok.com'
+})
+
 
 class ChannelParser:
     """
@@ -27,20 +43,10 @@ class ChannelParser:
     
     def __init__(self):
         """Initialize the channel parser"""
-        self.tiktok_domains = [
-            'www.tiktok.com',
-            'tiktok.com',
-            'vm.tiktok.com',
-            'm.tiktok.com'
-        ]
+        self.tiktok_domains = _TIKTOK_DOMAINS
         
-        # Regex patterns for different URL formats
-        self.patterns = {
-            'username_url': r'https?://(?:www\.)?tiktok\.com/@([^/?]+)',
-            'username_direct': r'^@?([a-zA-Z0-9._-]+)$',
-            'short_url': r'https?://vm\.tiktok\.com/([a-zA-Z0-9]+)',
-            'mobile_url': r'https?://m\.tiktok\.com/@([^/?]+)',
-        }
+        # Compiled regex patterns for different URL formats
+        self.patterns = _CHANNEL_PATTERNS
     
     def parse_channel_input(self, input_string):
         """
@@ -90,19 +96,19 @@ class ChannelParser:
             username = None
             
             # Pattern 1: /@username format
-            username_match = re.search(self.patterns['username_url'], url)
+            username_match = self.patterns['username_url'].search(url)
             if username_match:
                 username = username_match.group(1)
             
             # Pattern 2: Mobile URL format
             if not username:
-                mobile_match = re.search(self.patterns['mobile_url'], url)
+                mobile_match = self.patterns['mobile_url'].search(url)
                 if mobile_match:
                     username = mobile_match.group(1)
             
             # Pattern 3: Short URL (vm.tiktok.com) - these need to be resolved
             if not username:
-                short_match = re.search(self.patterns['short_url'], url)
+                short_match = self.patterns['short_url'].search(url)
                 if short_match:
                     return self._create_error_result(url, "Short URLs need to be resolved first. Please use the full TikTok profile URL.")
             
@@ -172,7 +178,7 @@ class ChannelParser:
             return False
         
         # Check for valid characters
-        if not re.match(r'^[a-zA-Z0-9._-]+$', username):
+        if not _USERNAME_CHARS_RE.match(username):
             return False
         
         # Cannot start or end with special characters
@@ -180,7 +186,7 @@ class ChannelParser:
             return False
         
         # Cannot have consecutive special characters
-        if re.search(r'[._-]{2,}', username):
+        if _CONSECUTIVE_SPECIAL_RE.search(username):
             return False
         
         return True
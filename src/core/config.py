@@ -11,6 +11,21 @@ BROWSER_CONFIG = {
     "disable_gpu": False,  # Enable GPU acceleration
     "window_size": "1920,1080",
     "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "driver_cache_dir": "~/.cache/tiktok_search_tool",  # Cached ChromeDriver paths per Chrome version
+    "pool_size": 1,  # Warm browsers kept for reuse across searches
+    "pool_idle_timeout": 300,  # seconds before idle pooled browsers are shut down
+    "login_idle_timeout": 300,  # seconds before the unused login/search browser is closed
+    "page_ready_timeout": 10,  # seconds to wait for TikTok pages to render login/profile links
+    "session_max_age": 86400,  # seconds a saved login is trusted before prompting again
+    "login_cookie_name": "sessionid",  # cookie TikTok sets once the user is logged in
+    "login_cookie_timeout": 300,  # seconds to watch for the login cookie before asking the user to confirm
+    "page_load_strategy": "eager",  # driver.get() returns at DOMContentLoaded instead of full load
+    "search_disable_images": True,  # Skip image downloads in search-only browsers (login browsers keep them)
+    # URL patterns blocked via CDP while scraping search results (never during login)
+    "search_blocked_urls": [
+        "*.jpg", "*.jpeg", "*.png", "*.webp", "*.mp4", "*.m4s", "*.woff*",
+        "*google-analytics*", "*doubleclick*", "*tiktokcdn*/video*",
+    ],
     # Proxy configuration - uncomment and set if needed
     # "proxy": {
     #     "http": "http://your-proxy-server:port",
@@ -24,6 +39,16 @@ SEARCH_CONFIG = {
     "page_load_timeout": 30,  # seconds
     "dynamic_content_wait": 15,  # seconds - increased for visibility
     "scroll_pause": 5,  # seconds between scrolls - increased for visibility
+    "scroll_poll_interval": 0.05,  # seconds between page height checks while content loads
+    "scroll_stable_polls": 2,  # unchanged height checks before a scroll counts as loaded
+    "dynamic_content_settle": 0.3,  # seconds to let cards finish rendering once found
+    "scroll_min_new_links": 1,  # stop scrolling once a scroll adds fewer new links than this
+    # CSS selectors for video cards on search results; any match means content has loaded
+    "video_card_selectors": [
+        '[data-e2e="search_top-item"]',
+        '[data-e2e="search-card-video"]',
+        'a[href*="/video/"]',
+    ],
     "max_results_limit": 1000  # Maximum number of results to collect (safety limit)
 }
 
@@ -42,7 +67,8 @@ EXCEL_CONFIG = {
     "default_filename": "excel_files/tiktok_search_results.xlsx",
     "sheet_name": "TikTok Videos",
     "headers": ['URL', 'Username', 'Video ID', 'Title', 'Search Query', 'Added Date'],
-    "max_column_width": 50
+    "max_column_width": 50,
+    "links_cache_suffix": ".links.json"  # Side-car file caching the URL set of a workbook
 }
 
 # Messages and UI
@@ -56,6 +82,7 @@ MESSAGES = {
     "extracting": "🔍 Extracting video links...",
     "found_links": "✅ Found {count} unique video links",
     "processing": "📹 Processing video {current}/{total}",
+    "processing_batch": "📹 Processing {count} videos",
     "success": "🎉 Successfully processed {count} videos",
     "no_videos": "❌ No videos found",
     "saving": "💾 Saving {count} videos to {filename}",
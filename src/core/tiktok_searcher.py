@@ -4,14 +4,12 @@ Orchestrates the search process using browser, utils, and Excel modules
 """
 
 import datetime
-from src.managers.browser_manager import BrowserManager
+from src.managers.browser_manager import BrowserPool
 from src.managers.excel_manager import ExcelManager
 from src.utils.utils import (
-    find_tiktok_links, 
-    extract_video_info, 
+    extract_video_info_batch, 
     build_search_url, 
-    generate_filename,
-    format_progress
+    generate_filename
 )
 from src.core.config import SEARCH_CONFIG, MESSAGES
 
@@ -43,75 +41,70 @@ class TikTokSearcher:
         videos = []
         
         try:
-            # Initialize browser manager
-            self.browser_manager = BrowserManager()
-            
-            # Build search URL
-            search_url = build_search_url(query)
-            
-            # Navigate to search page
-            if not self.browser_manager.navigate_to_url(search_url):
-                return []
-            
-            # Wait for dynamic content
-            self.browser_manager.wait_for_dynamic_content()
-            
-            # Scroll to load more content
-            self.browser_manager.scroll_to_load_content(scroll_count)
-            
-            # Get page source
-            page_source = self.browser_manager.get_page_source()
-            
-            # Extract video links
-            print(MESSAGES["extracting"])
-            unique_links = find_tiktok_links(page_source)
-            
-            print(MESSAGES["found_links"].format(count=len(unique_links)))
-            
-            if unique_links:
-                # Apply safety limit to prevent excessive results
-                max_limit = SEARCH_CONFIG["max_results_limit"]
-                if len(unique_links) > max_limit:
-                    print(f"⚠️  Found {len(unique_links)} links, limiting to {max_limit} for safety")
-                    unique_links = unique_links[:max_limit]
+            # Lease a warm browser from the shared pool
+            with BrowserPool.get().lease() as browser_manager:
+                self.browser_manager = browser_manager
+                    
+                # Build search URL
+                search_url = build_search_url(query)
                 
-                # Extract additional info for each video
-                for i, link in enumerate(unique_links, 1):
-                    progress = format_progress(i, len(unique_links))
-                    print(MESSAGES["processing"].format(current=i, total=len(unique_links)))
+                # Navigate to search page
+                if not self.browser_manager.navigate_to_url(search_url):
+                    return []
+                
+                # Wait for dynamic content
+                self.browser_manager.wait_for_dynamic_content()
+                
+                # Scroll to load more content
+                self.browser_manager.scroll_to_load_content(scroll_count)
+                
+                # Extract video links (anchor hrefs only, not the full page source)
+                print(MESSAGES["extracting"])
+                unique_links = self.browser_manager.get_video_links()
+                
+                print(MESSAGES["found_links"].format(count=len(unique_links)))
+                
+                if unique_links:
+                    # Apply safety limit to prevent excessive results
+                    max_limit = SEARCH_CONFIG["max_results_limit"]
+                    if len(unique_links) > max_limit:
+                        print(f"⚠️  Found {len(unique_links)} links, limiting to {max_limit} for safety")
+                        unique_links = unique_links[:max_limit]
                     
-                    # Extract username and video ID
-                    username, video_id = extract_video_info(link)
+                    # Username and video ID for each link
+                    print(MESSAGES["processing_batch"].format(count=len(unique_links)))
+                    video_infos = extract_video_info_batch(unique_links)
                     
-                    # Get current timestamp for when this video was added
+                    # All videos from one search share the time they were added
                     current_timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     
-                    video_info = {
-                        'url': link,
-                        'username': username,
-                        'video_id': video_id,
-                        'title': f"Video by @{username}",
-                        'search_query': query,
-                        'added_date': current_timestamp
-                    }
-                    videos.append(video_info)
+                    videos = [
+                        {
+                            'url': link,
+                            'username': username,
+                            'video_id': video_id,
+                            'title': f"Video by @{username}",
+                            'search_query': query,
+                            'added_date': current_timestamp
+                        }
+                        for link, (username, video_id) in zip(unique_links, video_infos)
+                    ]
+                    
+                    print(MESSAGES["success"].format(count=len(videos)))
+                else:
+                    print(MESSAGES["no_videos"])
+                    print("💡 This might be due to TikTok's anti-bot measures")
+                    print("💡 Try using a different search term or try again later")
                 
-                print(MESSAGES["success"].format(count=len(videos)))
-            else:
-                print(MESSAGES["no_videos"])
-                print("💡 This might be due to TikTok's anti-bot measures")
-                print("💡 Try using a different search term or try again later")
-            
-            return videos
+                return videos
             
         except Exception as e:
             print(f"❌ Error during search: {e}")
             return []
         
         finally:
-            # Cleanup browser
-            if self.browser_manager:
-                self.browser_manager.cleanup()
+            # The browser goes back to the pool rather than being closed
+            self.browser_manager = None
     
     def save_to_excel(self, videos, filename=None):
         """
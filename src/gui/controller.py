@@ -253,17 +253,17 @@ class GUIController:
             'webdriver_manager'
         ]
         
+        # Only locate the packages - importing them would run their top-level code
+        import importlib.util
         for package in required_packages:
-            try:
-                __import__(package)
-            except ImportError:
+            if importlib.util.find_spec(package) is None:
                 issues.append(f"Required package '{package}' is not installed")
         
         # Check Chrome browser
         try:
             from selenium import webdriver
             from selenium.webdriver.chrome.options import Options
-            from webdriver_manager.chrome import ChromeDriverManager
+            from src.managers.browser_manager import get_chromedriver_path
             
             # Try to create a Chrome driver instance
             chrome_options = Options()
@@ -271,7 +271,7 @@ class GUIController:
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             
-            service = webdriver.chrome.service.Service(ChromeDriverManager().install())
+            service = webdriver.chrome.service.Service(get_chromedriver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
             driver.quit()
             
@@ -3,6 +3,8 @@ Results Display Widget
 Handles display of search results in a table format with export functionality
 """
 
+import weakref
+import webbrowser
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from src.gui.styles import (
@@ -11,6 +13,37 @@ from src.gui.styles import (
     apply_label_style
 )
 
+# Titles longer than this are elided in the table (full text is kept for export)
+_TITLE_MAX = 80
+
+# Shared bind tag for all results tables; the right-click handler is bound once
+# on this tag instead of once per Treeview instance
+RESULTS_TREE_TAG = 'Treeview.results'
+
+# Maps Treeview widget paths to their owning ResultsWidget
+_results_widgets = weakref.WeakValueDictionary()
+_class_binding_registered = False
+
+
+def _on_results_tree_right_click(event):
+    """Dispatch a right-click on any results table to its ResultsWidget"""
+    widget = _results_widgets.get(str(event.widget))
+    if widget is not None:
+        widget._on_right_click(event)
+
+
+def _register_class_binding(tree):
+    """
+    Register the shared right-click binding (only once per application)
+    
+    Args:
+        tree: Any Treeview, used to reach the Tk interpreter
+    """
+    global _class_binding_registered
+    if not _class_binding_registered:
+        tree.bind_class(RESULTS_TREE_TAG, '<Button-3>', _on_results_tree_right_click)
+        _class_binding_registered = True
+
 
 class ResultsWidget(tk.Frame):
     """
@@ -38,6 +71,7 @@ class ResultsWidget(tk.Frame):
         # Widget state
         self.results = []
         self.results_count_var = tk.StringVar(value="No results")
+        self._last_count_text = "No results"
         
         self._setup_ui()
         self._apply_styles()
@@ -49,7 +83,7 @@ class ResultsWidget(tk.Frame):
         self.configure(bg=COLORS['bg_primary'])
         
         # Header frame
-        self.header_frame = tk.Frame(self, bg=COLORS['bg_secondary'], relief='raised', bd=2, highlightbackground=COLORS['border_accent'], highlightthickness=1)
+        self.header_frame = tk.Frame(self, bg=COLORS['bg_secondary'], relief='solid', bd=1)
         self.header_frame.pack(fill='x', padx=LAYOUT['padding'], pady=LAYOUT['spacing'])
         
         # Results title
@@ -137,7 +171,11 @@ class ResultsWidget(tk.Frame):
         
         # Bind events
         self.tree.bind('<Double-1>', self._on_item_double_click)
-        self.tree.bind('<Button-3>', self._on_right_click)  # Right-click context menu
+        
+        # Right-click context menu (shared class binding)
+        _register_class_binding(self.tree)
+        self.tree.bindtags((RESULTS_TREE_TAG,) + self.tree.bindtags())
+        _results_widgets[str(self.tree)] = self
     
     def _setup_treeview(self):
         """Setup treeview styling and configuration"""
@@ -209,7 +247,6 @@ class ResultsWidget(tk.Frame):
         item = self.tree.selection()[0] if self.tree.selection() else None
         if item:
             url = self.tree.item(item, 'text')
-            import webbrowser
             webbrowser.open(url)
     
     def _copy_to_clipboard(self, text):
@@ -237,32 +274,53 @@ class ResultsWidget(tk.Frame):
         
         # Add new items
         for result in self.results:
-            self.tree.insert('', 'end', 
-                text=result.get('url', ''),
-                values=(
-                    result.get('username', ''),
-                    result.get('video_id', ''),
-                    result.get('title', ''),
-                    result.get('added_date', '')
-                )
+            self._insert_row(result)
+    
+    def _insert_row(self, result):
+        """
+        Insert a single result row into the table
+        
+        Long titles are truncated for display only; self.results keeps the
+        full text for export and selection.
+        
+        Args:
+            result (dict): Video result dictionary
+        """
+        title = result.get('title', '')
+        if len(title) > _TITLE_MAX:
+            title = title[:_TITLE_MAX - 1] + '…'
+        
+        self.tree.insert('', 'end',
+            text=result.get('url', ''),
+            values=(
+                result.get('username', ''),
+                result.get('video_id', ''),
+                title,
+                result.get('added_date', '')
             )
+        )
     
     def _update_count(self):
         """Update the results count display"""
         count = len(self.results)
         if count == 0:
-            self.results_count_var.set("No results")
+            text = "No results"
         elif count == 1:
-            self.results_count_var.set("1 result found")
+            text = "1 result found"
         else:
-            self.results_count_var.set(f"{count} results found")
+            text = f"{count} results found"
+        
+        # Skip the StringVar write (and its traces/relayout) when unchanged
+        if text != self._last_count_text:
+            self.results_count_var.set(text)
+            self._last_count_text = text
     
     def clear_results(self):
         """Clear all results from the table"""
         self.results = []
         for item in self.tree.get_children():
             self.tree.delete(item)
-        self.results_count_var.set("No results")
+        self._update_count()
         self.pack_forget()
     
     def add_result(self, result):
@@ -273,15 +331,7 @@ class ResultsWidget(tk.Frame):
             result (dict): Video result dictionary
         """
         self.results.append(result)
-        self.tree.insert('', 'end',
-            text=result.get('url', ''),
-            values=(
-                result.get('username', ''),
-                result.get('video_id', ''),
-                result.get('title', ''),
-                result.get('added_date', '')
-            )
-        )
+        self._insert_row(result)
         self._update_count()
     
     def get_selected_results(self):
@@ -298,11 +348,19 @@ class ResultsWidget(tk.Frame):
             url = self.tree.item(item, 'text')
             values = self.tree.item(item, 'values')
             
+            # Rows are inserted in results order, so the row index maps back
+            # to the untruncated title
+            index = self.tree.index(item)
+            if index < len(self.results):
+                title = self.results[index].get('title', '')
+            else:
+                title = values[2] if len(values) > 2 else ''
+            
             result = {
                 'url': url,
                 'username': values[0] if len(values) > 0 else '',
                 'video_id': values[1] if len(values) > 1 else '',
-                'title': values[2] if len(values) > 2 else '',
+                'title': title,
                 'added_date': values[3] if len(values) > 3 else ''
             }
             selected_results.append(result)
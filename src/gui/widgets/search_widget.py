@@ -3,6 +3,7 @@ Search Input Widget
 Handles search query input, max results selection, and search controls
 """
 
+import functools
 import tkinter as tk
 from tkinter import ttk
 from src.gui.styles import (
@@ -12,6 +13,20 @@ from src.gui.styles import (
 )
 from src.channel_search.channel_parser import ChannelParser
 
+# Scroll count options offered in the selector (shared by all instances)
+_SCROLL_COUNT_CHOICES = ("3", "5", "10", "15", "20", "50", "100", "200", "300", "400", "500")
+
+# Delay before validating channel input, so only the last keystroke of a burst
+# runs the parser (milliseconds)
+_VALIDATE_DELAY_MS = 200
+
+# Radio button keyword arguments, resolved once at import instead of per instance
+_RADIO_KW = {
+    'bg': COLORS['bg_primary'],
+    'fg': COLORS['text_primary'],
+    'selectcolor': COLORS['accent_blue']
+}
+
 
 class SearchWidget(tk.Frame):
     """
@@ -51,8 +66,22 @@ class SearchWidget(tk.Frame):
         # Initialize parser
         self.parser = ChannelParser()
         
-        # Bind input validation
-        self.search_var.trace('w', self._on_input_change)
+        # Memoized validation - users retype and backspace over the same prefixes
+        self._validate_cached = functools.lru_cache(maxsize=512)(self.parser.validate_and_format)
+        
+        # Pending debounced validation (Tk after id)
+        self._validate_after_id = None
+        
+        # Last login state shown on the login button (None until first update)
+        self._last_login_state = None
+        
+        # Channel status colors, resolved once; last applied color skips no-op configures
+        self._status_colors = {
+            'success': COLORS.get('text_success', '#28a745'),
+            'error': COLORS.get('text_error', '#dc3545'),
+            'normal': COLORS['text_secondary']
+        }
+        self._last_status_color = None
         
         self._setup_ui()
         self._apply_styles()
@@ -101,9 +130,7 @@ class SearchWidget(tk.Frame):
             variable=self.search_type_var,
             value="subject",
             command=self._on_search_type_change,
-            bg=COLORS['bg_primary'],
-            fg=COLORS['text_primary'],
-            selectcolor=COLORS['accent_blue']
+            **_RADIO_KW
         )
         self.subject_radio.pack(side='left', padx=(0, LAYOUT['spacing']))
         
@@ -113,9 +140,7 @@ class SearchWidget(tk.Frame):
             variable=self.search_type_var,
             value="channel",
             command=self._on_search_type_change,
-            bg=COLORS['bg_primary'],
-            fg=COLORS['text_primary'],
-            selectcolor=COLORS['accent_blue']
+            **_RADIO_KW
         )
         self.channel_radio.pack(side='left')
         
@@ -138,6 +163,8 @@ class SearchWidget(tk.Frame):
         )
         self.query_entry.pack(fill='x', pady=(LAYOUT['spacing'], LAYOUT['padding']))
         self.query_entry.bind('<Return>', self._on_search_clicked)
+        # Validate on actual keystrokes only, not on every write to search_var
+        self.query_entry.bind('<KeyRelease>', self._on_input_change)
         
         # Channel validation status (initially hidden)
         self.channel_status_label = tk.Label(
@@ -162,7 +189,7 @@ class SearchWidget(tk.Frame):
         self.scroll_count_combo = ttk.Combobox(
             self.controls_frame,
             textvariable=self.scroll_count_var,
-            values=["3", "5", "10", "15", "20", "50", "100", "200", "300", "400", "500"],
+            values=_SCROLL_COUNT_CHOICES,
             state="readonly",
             width=8
         )
@@ -191,7 +218,7 @@ class SearchWidget(tk.Frame):
         self.clear_button.pack(side='left')
         
         # Login status frame
-        self.login_frame = tk.Frame(self, bg=COLORS['bg_secondary'], relief='raised', bd=2, highlightbackground=COLORS['border_accent'], highlightthickness=1)
+        self.login_frame = tk.Frame(self, bg=COLORS['bg_secondary'], relief='solid', bd=1)
         self.login_frame.pack(fill='x', padx=LAYOUT['padding'], pady=LAYOUT['spacing'])
         
         self.login_label = tk.Label(
@@ -236,17 +263,32 @@ class SearchWidget(tk.Frame):
             self.query_label.configure(text="Channel URL or Username:")
             self.search_button.configure(text="📺 Search Channel")
             self.channel_status_label.pack(anchor='w', pady=(0, LAYOUT['spacing']))
-            self._on_input_change()  # Validate current input
+            self._cancel_pending_validation()
+            self._do_validate()  # Validate current input
         else:
             # Update UI for subject search
+            self._cancel_pending_validation()
             self.query_label.configure(text="Search Query:")
             self.search_button.configure(text="🔍 Search")
             self.channel_status_label.pack_forget()
             # Clear any channel validation status
             self.channel_status_var.set("Enter channel URL or username")
     
-    def _on_input_change(self, *args):
-        """Handle input change for real-time validation"""
+    def _on_input_change(self, event=None):
+        """Handle input change by scheduling a debounced validation"""
+        self._cancel_pending_validation()
+        self._validate_after_id = self.after(_VALIDATE_DELAY_MS, self._do_validate)
+    
+    def _cancel_pending_validation(self):
+        """Cancel a scheduled validation, if any"""
+        if self._validate_after_id:
+            self.after_cancel(self._validate_after_id)
+            self._validate_after_id = None
+    
+    def _do_validate(self):
+        """Validate the current channel input and update the status label"""
+        self._validate_after_id = None
+        
         if self.search_type_var.get() != "channel":
             return
             
@@ -258,7 +300,7 @@ class SearchWidget(tk.Frame):
             return
         
         # Validate input
-        is_valid, formatted, error = self.parser.validate_and_format(input_text)
+        is_valid, formatted, error = self._validate_cached(input_text)
         
         if is_valid:
             self.channel_status_var.set(formatted)
@@ -269,12 +311,12 @@ class SearchWidget(tk.Frame):
     
     def _update_status_color(self, status_type):
         """Update status label color based on validation"""
-        if status_type == "success":
-            self.channel_status_label.configure(fg=COLORS.get('text_success', '#28a745'))
-        elif status_type == "error":
-            self.channel_status_label.configure(fg=COLORS.get('text_error', '#dc3545'))
-        else:
-            self.channel_status_label.configure(fg=COLORS['text_secondary'])
+        color = self._status_colors.get(status_type, self._status_colors['normal'])
+        if color == self._last_status_color:
+            return
+        
+        self.channel_status_label.configure(fg=color)
+        self._last_status_color = color
     
     def _on_search_clicked(self, event=None):
         """Handle search button click or Enter key press"""
@@ -292,7 +334,7 @@ class SearchWidget(tk.Frame):
         
         if search_type == "channel":
             # Validate channel input
-            is_valid, formatted, error = self.parser.validate_and_format(query)
+            is_valid, formatted, error = self._validate_cached(query)
             if not is_valid:
                 self._show_error(f"Invalid channel input: {error}")
                 return
@@ -306,6 +348,7 @@ class SearchWidget(tk.Frame):
     
     def _on_clear_clicked(self):
         """Handle clear button click"""
+        self._cancel_pending_validation()
         self.search_var.set("")
         self.scroll_count_var.set("5")
         self.channel_status_var.set("Enter channel URL or username")
@@ -334,13 +377,15 @@ class SearchWidget(tk.Frame):
         """
         self.login_status_var.set(status)
         
-        # Update login button text and style
-        if is_logged_in:
-            self.login_button.configure(text="✅ Logged In")
-            apply_button_style(self.login_button, 'success')
-        else:
-            self.login_button.configure(text="🔐 Login")
-            apply_button_style(self.login_button, 'warning')
+        # Restyle the login button only when the logged-in state changes
+        if is_logged_in != self._last_login_state:
+            if is_logged_in:
+                self.login_button.configure(text="✅ Logged In")
+                apply_button_style(self.login_button, 'success')
+            else:
+                self.login_button.configure(text="🔐 Login")
+                apply_button_style(self.login_button, 'warning')
+            self._last_login_state = is_logged_in
     
     def set_search_enabled(self, enabled):
         """
@@ -378,5 +423,7 @@ class SearchWidget(tk.Frame):
             query (str): Search query
             scroll_count (int): Number of scrolls to perform
         """
+        self._cancel_pending_validation()
         self.search_var.set(query)
-        self.scroll_count_var.set(str(scroll_count))
\ No newline at end of file
+        self.scroll_count_var.set(str(scroll_count))
+        self._do_validate()
\ No newline at end of file
@@ -1,18 +1,167 @@
 """
 Browser management for TikTok Search Tool
 Handles Chrome driver setup, navigation, and cleanup
+
+Selenium and webdriver-manager are imported inside the methods that use them
+so that importing this module (and starting the GUI) stays fast.
 """
 
+import os
+import re
 import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import collections
+import atexit
+import hashlib
+import platform
+import threading
+import subprocess
+from contextlib import contextmanager
 from src.core.config import BROWSER_CONFIG, SEARCH_CONFIG, MESSAGES
 
+# Commands that print the installed Chrome version, tried in order
+CHROME_VERSION_COMMANDS = [
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+    ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+]
+
+# Hrefs of the video anchors currently in the DOM (far smaller than page_source)
+VIDEO_HREFS_SCRIPT = "return Array.from(document.querySelectorAll('a[href*=\"/video/\"]'), a => a.href);"
+
+# Chrome switches shared by the search and login browsers. BROWSER_CONFIG is
+# fixed for the life of the process, so the argument strings are built once here.
+CHROME_BASE_ARGS = tuple(
+    [
+        "--disable-blink-features=AutomationControlled",
+        "--disable-extensions",
+        "--disable-plugins",
+        "--disable-web-security",
+        "--allow-running-insecure-content",
+        f"--window-size={BROWSER_CONFIG['window_size']}",
+        f"--user-agent={BROWSER_CONFIG['user_agent']}",
+    ]
+    + (["--no-sandbox"] if BROWSER_CONFIG["no_sandbox"] else [])
+    + (["--disable-dev-shm-usage"] if BROWSER_CONFIG["disable_dev_shm_usage"] else [])
+    + (["--disable-gpu"] if BROWSER_CONFIG["disable_gpu"] else [])
+)
+
+# Search browser: optionally headless, and it never needs images
+SEARCH_CHROME_ARGS = (
+    CHROME_BASE_ARGS
+    + ("--disable-features=InterestFeedContentSuggestions,Translate",)
+    + (("--headless",) if BROWSER_CONFIG["headless"] else ())
+    + (("--blink-settings=imagesEnabled=false",) if BROWSER_CONFIG["search_disable_images"] else ())
+)
+
+# ChromeDriver path resolved by this process (skips the version probe and cache file)
+_driver_path = None
+
+
+def get_chrome_major_version():
+    """
+    Detect the major version of the locally installed Chrome
+    
+    Returns:
+        str: Major version (e.g. "120"), or None if Chrome could not be found
+    """
+    for command in CHROME_VERSION_COMMANDS:
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'(\d+)\.\d+\.\d+', result.stdout)
+        if match:
+            return match.group(1)
+    return None
+
+
+def get_chromedriver_path():
+    """
+    Get a ChromeDriver path, reusing the one cached for this Chrome version
+    
+    ChromeDriverManager().install() checks the network on every call. The
+    resolved path is cached on disk keyed by Chrome major version and platform,
+    so install() only runs again when the binary is missing or Chrome updates.
+    The path is also kept in memory for the rest of the process.
+    
+    Returns:
+        str: Path to the ChromeDriver executable
+    """
+    global _driver_path
+    if _driver_path and os.path.exists(_driver_path):
+        return _driver_path
+    
+    from webdriver_manager.chrome import ChromeDriverManager
+    
+    cache_dir = os.path.expanduser(BROWSER_CONFIG["driver_cache_dir"])
+    key = f"{get_chrome_major_version()}-{platform.system()}-{platform.machine()}"
+    cache_file = os.path.join(cache_dir, f"driver_{hashlib.sha1(key.encode()).hexdigest()[:12]}")
+    
+    try:
+        with open(cache_file, 'r') as f:
+            cached_path = f.read().strip()
+        if cached_path and os.path.exists(cached_path):
+            _driver_path = cached_path
+            return cached_path
+    except OSError:
+        pass
+    
+    driver_path = ChromeDriverManager().install()
+    
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            f.write(driver_path)
+    except OSError as e:
+        print(f"⚠️  Warning: Could not cache Chrome driver path: {e}")
+    
+    _driver_path = driver_path
+    return driver_path
+
+
+def set_resource_blocking(driver, enabled):
+    """
+    Block (or unblock) heavy resources such as media, fonts and analytics via CDP
+    
+    Only the HTML and video anchors matter when scraping search results.
+    Blocking is turned off again for pages the user interacts with (login).
+    
+    Args:
+        driver: Selenium Chrome WebDriver
+        enabled (bool): True to block BROWSER_CONFIG["search_blocked_urls"], False to clear
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        urls = BROWSER_CONFIG["search_blocked_urls"] if enabled else []
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+    except Exception as e:
+        print(f"⚠️  Warning: Could not update resource blocking: {e}")
+
+
+def collect_video_links(driver):
+    """
+    Get the TikTok video links currently on the page
+    
+    Reads only the video anchors' hrefs in the browser, falling back to the
+    full page source when the page has none (e.g. a different TikTok layout).
+    
+    Args:
+        driver: Selenium WebDriver showing TikTok results
+        
+    Returns:
+        list: Unique TikTok video URLs in page order
+    """
+    from src.utils.utils import find_tiktok_links
+    
+    hrefs = driver.execute_script(VIDEO_HREFS_SCRIPT)
+    if hrefs:
+        # Run through the URL patterns too, which drops query strings and non-video links
+        return find_tiktok_links("\n".join(hrefs))
+    return find_tiktok_links(driver.page_source)
+
 
 class BrowserManager:
     """Manages Chrome browser operations for TikTok scraping"""
@@ -24,30 +173,20 @@ class BrowserManager:
     
     def setup_driver(self):
         """Setup Chrome driver with proper options"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        
         try:
             chrome_options = Options()
             
-            # Apply browser configuration
-            if BROWSER_CONFIG["headless"]:
-                chrome_options.add_argument("--headless")
-            if BROWSER_CONFIG["no_sandbox"]:
-                chrome_options.add_argument("--no-sandbox")
-            if BROWSER_CONFIG["disable_dev_shm_usage"]:
-                chrome_options.add_argument("--disable-dev-shm-usage")
-            if BROWSER_CONFIG["disable_gpu"]:
-                chrome_options.add_argument("--disable-gpu")
-            
-            # Add security and compatibility options to make Chrome more secure
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+            for arg in SEARCH_CHROME_ARGS:
+                chrome_options.add_argument(arg)
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
             
-            chrome_options.add_argument(f"--window-size={BROWSER_CONFIG['window_size']}")
-            chrome_options.add_argument(f"--user-agent={BROWSER_CONFIG['user_agent']}")
+            # Don't block on trackers/ads after the DOM is ready
+            chrome_options.page_load_strategy = BROWSER_CONFIG["page_load_strategy"]
             
             # Try to use local Chrome driver first
             try:
@@ -57,7 +196,7 @@ class BrowserManager:
                 try:
                     # Fallback to ChromeDriverManager
                     print("⚠️  Local Chrome driver not found, attempting automatic download...")
-                    service = Service(ChromeDriverManager().install())
+                    service = Service(get_chromedriver_path())
                     self.driver = webdriver.Chrome(service=service, options=chrome_options)
                 except Exception as manager_error:
                     print("❌ Both local and automatic Chrome driver setup failed")
@@ -66,6 +205,9 @@ class BrowserManager:
                     print("💡 Place chromedriver.exe in the same directory as your script")
                     raise Exception(f"Chrome driver setup failed: {str(manager_error)}")
             
+            # This browser only scrapes search results
+            set_resource_blocking(self.driver, True)
+            
         except Exception as e:
             print(f"❌ Error setting up Chrome driver: {e}")
             print("💡 Make sure Chrome browser is installed on your system")
@@ -81,6 +223,10 @@ class BrowserManager:
         Returns:
             bool: True if navigation successful, False otherwise
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
             print(f"🌐 Navigating to: {url}")
             print("⏳ Opening TikTok search page...")
@@ -105,16 +251,37 @@ class BrowserManager:
             return False
     
     def wait_for_dynamic_content(self):
-        """Wait for dynamic content to load"""
+        """
+        Wait for dynamic content to load
+        
+        Returns as soon as any configured video card selector matches, with
+        SEARCH_CONFIG["dynamic_content_wait"] as the upper bound.
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
         print("⏳ Waiting for TikTok content to load...")
         print("🔄 TikTok uses dynamic loading - waiting for videos to appear...")
-        time.sleep(SEARCH_CONFIG["dynamic_content_wait"])
-        print("✅ Dynamic content should be loaded now")
+        conditions = [
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            for selector in SEARCH_CONFIG["video_card_selectors"]
+        ]
+        try:
+            WebDriverWait(self.driver, SEARCH_CONFIG["dynamic_content_wait"]).until(EC.any_of(*conditions))
+            # Short settle so the first batch of cards finishes rendering
+            time.sleep(SEARCH_CONFIG["dynamic_content_settle"])
+            print("✅ Dynamic content loaded")
+        except TimeoutException:
+            print("⚠️  No video cards detected before timeout, continuing...")
     
     def scroll_to_load_content(self, scroll_count=None):
         """
         Scroll down to load more content
         
+        Stops early once the feed stops growing.
+        
         Args:
             scroll_count (int): Number of scrolls to perform. If None, uses default from config.
         """
@@ -124,12 +291,66 @@ class BrowserManager:
         print(f"📜 Starting to scroll to load more videos... ({scroll_count} scrolls)")
         for i in range(scroll_count):
             print(f"📜 Scroll {i+1}/{scroll_count} - Loading more videos...")
+            previous_height = self._get_scroll_height()
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(SEARCH_CONFIG["scroll_pause"])
-            print(f"✅ Scroll {i+1} completed - waiting for content to load...")
+            
+            if not self._wait_for_scroll_growth(previous_height):
+                print(f"🛑 No new content after scroll {i+1} - stopping early")
+                break
+            print(f"✅ Scroll {i+1} completed - new content loaded")
         
         print("🎯 Finished scrolling - all available videos should be loaded")
     
+    def _get_scroll_height(self):
+        """
+        Get the current document height
+        
+        Returns:
+            int: document.body.scrollHeight
+        """
+        return self.driver.execute_script("return document.body.scrollHeight")
+    
+    def _wait_for_scroll_growth(self, previous_height):
+        """
+        Wait until the page grows after a scroll and then settles
+        
+        Polls the document height instead of sleeping for the full scroll
+        pause. Returns as soon as the height has grown and stayed unchanged
+        for a few polls; gives up after SEARCH_CONFIG["scroll_pause"] seconds.
+        
+        Args:
+            previous_height (int): Document height before the scroll
+            
+        Returns:
+            bool: True if new content was loaded, False otherwise
+        """
+        interval = SEARCH_CONFIG["scroll_poll_interval"]
+        deadline = time.monotonic() + SEARCH_CONFIG["scroll_pause"]
+        last_height = previous_height
+        stable_polls = 0
+        
+        while time.monotonic() < deadline:
+            time.sleep(interval)
+            height = self._get_scroll_height()
+            if height != last_height:
+                last_height = height
+                stable_polls = 0
+            elif height > previous_height:
+                stable_polls += 1
+                if stable_polls >= SEARCH_CONFIG["scroll_stable_polls"]:
+                    return True
+        
+        return last_height > previous_height
+    
+    def get_video_links(self):
+        """
+        Get the TikTok video links on the current page
+        
+        Returns:
+            list: Unique TikTok video URLs in page order
+        """
+        return collect_video_links(self.driver)
+    
     def get_page_source(self):
         """
         Get the current page source
@@ -169,3 +390,154 @@ class BrowserManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup"""
         self.cleanup()
+
+
+class BrowserPool:
+    """
+    Pool of warm BrowserManager instances shared across searches
+    
+    Starting Chrome takes seconds, so instead of creating and closing a
+    browser for every search, searches lease one from the pool and return it
+    afterwards. Cookies are cleared and the page reset to about:blank between
+    leases. Idle browsers are shut down after BROWSER_CONFIG["pool_idle_timeout"].
+    
+    Usage:
+        with BrowserPool.get().lease() as browser_manager:
+            browser_manager.navigate_to_url(url)
+    """
+    
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    def __init__(self, size=None, idle_timeout=None):
+        """
+        Initialize the browser pool
+        
+        Args:
+            size (int): Maximum number of browsers (optional, defaults to config)
+            idle_timeout (float): Seconds before idle browsers are closed (optional)
+        """
+        self.size = size if size is not None else BROWSER_CONFIG["pool_size"]
+        self.idle_timeout = idle_timeout if idle_timeout is not None else BROWSER_CONFIG["pool_idle_timeout"]
+        self._idle = collections.deque()
+        self._created = 0
+        # Guards _idle and _created; notified whenever a browser or a slot frees up
+        self._available = threading.Condition()
+        self._idle_timer = None
+    
+    @classmethod
+    def get(cls):
+        """
+        Get the process-wide browser pool
+        
+        Returns:
+            BrowserPool: Shared pool instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.shutdown)
+            return cls._instance
+    
+    def acquire(self):
+        """
+        Take a browser from the pool, starting one if the pool is not full
+        
+        Blocks until a browser is released when all of them are in use.
+        
+        Returns:
+            BrowserManager: Browser ready for use
+        """
+        self._cancel_idle_timer()
+        
+        while True:
+            with self._available:
+                # Prefer an idle browser, otherwise take a free slot, otherwise
+                # wait until a lease is returned or a discarded browser frees a slot
+                while not self._idle and self._created >= self.size:
+                    self._available.wait()
+                if self._idle:
+                    browser_manager = self._idle.pop()
+                else:
+                    browser_manager = None
+                    self._created += 1
+            
+            if browser_manager is None:
+                try:
+                    return BrowserManager()
+                except Exception:
+                    self._free_slot()
+                    raise
+            
+            if browser_manager.is_driver_active():
+                return browser_manager
+            self._discard(browser_manager)
+    
+    def release(self, browser_manager):
+        """
+        Reset a browser and return it to the pool
+        
+        Args:
+            browser_manager (BrowserManager): Browser obtained from acquire()
+        """
+        try:
+            browser_manager.driver.delete_all_cookies()
+            browser_manager.driver.get("about:blank")
+        except Exception as e:
+            print(f"⚠️  Could not reset pooled browser, closing it: {e}")
+            self._discard(browser_manager)
+            return
+        
+        with self._available:
+            self._idle.append(browser_manager)
+            self._available.notify()
+        self._schedule_idle_shutdown()
+    
+    @contextmanager
+    def lease(self):
+        """
+        Context manager that acquires a browser and releases it on exit
+        
+        Yields:
+            BrowserManager: Browser ready for use
+        """
+        browser_manager = self.acquire()
+        try:
+            yield browser_manager
+        finally:
+            self.release(browser_manager)
+    
+    def shutdown(self):
+        """Close all idle browsers in the pool"""
+        self._cancel_idle_timer()
+        with self._available:
+            idle_browsers = list(self._idle)
+            self._idle.clear()
+        for browser_manager in idle_browsers:
+            self._discard(browser_manager)
+    
+    def _discard(self, browser_manager):
+        """Close a browser and free its pool slot"""
+        try:
+            browser_manager.cleanup()
+        finally:
+            self._free_slot()
+    
+    def _free_slot(self):
+        """Give a browser slot back and wake one waiting acquire()"""
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+    
+    def _schedule_idle_shutdown(self):
+        """(Re)start the idle timer that shuts down unused browsers"""
+        self._cancel_idle_timer()
+        self._idle_timer = threading.Timer(self.idle_timeout, self.shutdown)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+    
+    def _cancel_idle_timer(self):
+        """Cancel a pending idle shutdown"""
+        if self._idle_timer:
+            self._idle_timer.cancel()
+            self._idle_timer = None
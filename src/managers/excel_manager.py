@@ -1,12 +1,18 @@
 """
 Excel management for TikTok Search Tool
 Handles Excel file creation, formatting, and data saving
+
+openpyxl is imported inside the methods that use it so that importing this
+module (and starting the GUI) stays fast.
 """
 
+import json
 import os
-import openpyxl
 from src.core.config import EXCEL_CONFIG, MESSAGES
 
+# Hidden defined name caching the raw (unclamped) content width of each column
+COLUMN_WIDTHS_NAME = "_col_widths"
+
 
 class ExcelManager:
     """Manages Excel file operations for TikTok search results"""
@@ -19,7 +25,12 @@ class ExcelManager:
     
     def load_existing_workbook(self, filename):
         """
-        Load an existing Excel workbook if it exists
+        Load the existing links from an Excel workbook if it exists
+        
+        The links come from the side-car links cache when it is up to date;
+        otherwise only the URL column is read, using openpyxl's streaming
+        read-only mode without styles, VBA or external links. Call
+        open_workbook_for_append() before writing to the file.
         
         Args:
             filename (str): Path to the Excel file
@@ -28,12 +39,22 @@ class ExcelManager:
             bool: True if file exists and was loaded, False otherwise
         """
         if os.path.exists(filename):
+            if self._load_links_cache(filename):
+                print(f"📂 Loaded existing file: {filename}")
+                print(f"📊 Found {len(self.existing_links)} existing links")
+                return True
+            
+            import openpyxl
+            
             try:
-                self.workbook = openpyxl.load_workbook(filename)
-                self.worksheet = self.workbook.active
-                
-                # Extract existing links to avoid duplicates
-                self._extract_existing_links()
+                # Extract existing links with the streaming read-only parser
+                read_only_workbook = openpyxl.load_workbook(
+                    filename, read_only=True, keep_vba=False, keep_links=False, data_only=True
+                )
+                try:
+                    self._extract_existing_links(read_only_workbook.active)
+                finally:
+                    read_only_workbook.close()
                 
                 print(f"📂 Loaded existing file: {filename}")
                 print(f"📊 Found {len(self.existing_links)} existing links")
@@ -44,26 +65,84 @@ class ExcelManager:
                 return False
         return False
     
-    def _extract_existing_links(self):
+    def _links_cache_path(self, filename):
+        """
+        Get the path of the side-car links cache for a workbook
+        
+        Args:
+            filename (str): Path to the Excel file
+            
+        Returns:
+            str: Path to the links cache file
+        """
+        return filename + EXCEL_CONFIG["links_cache_suffix"]
+    
+    def _load_links_cache(self, filename):
+        """
+        Load existing links from the side-car cache if it is newer than the workbook
+        
+        Args:
+            filename (str): Path to the Excel file
+            
+        Returns:
+            bool: True if the cache was up to date and loaded, False otherwise
+        """
+        cache_path = self._links_cache_path(filename)
+        try:
+            if os.path.getmtime(cache_path) < os.path.getmtime(filename):
+                return False
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                self.existing_links = set(json.load(f))
+            return True
+        except (OSError, ValueError, TypeError):
+            return False
+    
+    def _save_links_cache(self, filename):
+        """
+        Write the current link set to the side-car cache of a workbook
+        
+        Args:
+            filename (str): Path to the Excel file
+        """
+        try:
+            with open(self._links_cache_path(filename), 'w', encoding='utf-8') as f:
+                json.dump(sorted(self.existing_links), f)
+        except OSError as e:
+            print(f"⚠️  Could not write links cache: {e}")
+    
+    def open_workbook_for_append(self, filename):
+        """
+        Fully load an existing workbook so new rows can be appended
+        
+        Args:
+            filename (str): Path to the Excel file
+        """
+        import openpyxl
+        
+        self.workbook = openpyxl.load_workbook(filename)
+        self.worksheet = self.workbook.active
+    
+    def _extract_existing_links(self, worksheet=None):
         """
         Extract existing video URLs from the worksheet to track duplicates
         
         This method reads all existing video URLs from the first column
         and stores them in a set for fast duplicate checking.
+        
+        Args:
+            worksheet: Worksheet to read (optional, defaults to self.worksheet)
         """
-        if not self.worksheet:
+        if worksheet is None:
+            worksheet = self.worksheet
+        if not worksheet:
             return
         
-        self.existing_links.clear()
-        
-        # Start from row 2 (after headers) and read all URLs from column 1
-        for row in range(2, self.worksheet.max_row + 1):
-            cell_value = self.worksheet.cell(row=row, column=1).value
-            if cell_value and isinstance(cell_value, str):
-                # Clean the URL and add to set
-                clean_url = cell_value.strip()
-                if clean_url:
-                    self.existing_links.add(clean_url)
+        # Start from row 2 (after headers) and stream raw values from column 1
+        self.existing_links = {
+            value.strip()
+            for (value,) in worksheet.iter_rows(min_row=2, max_col=1, values_only=True)
+            if isinstance(value, str) and value.strip()
+        }
     
     def filter_duplicate_videos(self, videos):
         """
@@ -76,16 +155,15 @@ class ExcelManager:
             tuple: (new_videos, duplicate_count) - filtered videos and count of duplicates
         """
         new_videos = []
-        duplicate_count = 0
-        
+        seen = set()  # URLs taken from this batch, so repeats within it are duplicates too
         for video in videos:
-            video_url = video.get('url', '').strip()
-            if video_url and video_url not in self.existing_links:
-                new_videos.append(video)
-                # Add to existing links set to prevent duplicates within the same batch
-                self.existing_links.add(video_url)
-            else:
-                duplicate_count += 1
+            url = (video.get('url') or '').strip()
+            if not url or url in seen or url in self.existing_links:
+                continue
+            seen.add(url)
+            new_videos.append(video)
+        self.existing_links.update(seen)
+        duplicate_count = len(videos) - len(new_videos)
         
         return new_videos, duplicate_count
     
@@ -96,6 +174,8 @@ class ExcelManager:
         Args:
             sheet_name (str): Name for the worksheet (optional)
         """
+        import openpyxl
+        
         self.workbook = openpyxl.Workbook()
         self.worksheet = self.workbook.active
         
@@ -107,7 +187,10 @@ class ExcelManager:
     
     def add_headers(self, headers=None):
         """
-        Add headers to the worksheet (only if they don't exist)
+        Write headers to the first row of the worksheet
+        
+        Only call this for a new worksheet; the caller knows whether the file
+        is new, so no worksheet probing (max_row or cell reads) is done here.
         
         Args:
             headers (list): List of header strings (optional)
@@ -115,55 +198,133 @@ class ExcelManager:
         if headers is None:
             headers = EXCEL_CONFIG["headers"]
         
-        # Only add headers if the worksheet is empty (row 1 is empty)
-        if self.worksheet.max_row == 0 or not self.worksheet.cell(row=1, column=1).value:
-            for col, header in enumerate(headers, 1):
-                self.worksheet.cell(row=1, column=col, value=header)
+        for col, header in enumerate(headers, 1):
+            self.worksheet.cell(row=1, column=col, value=header)
     
-    def add_data(self, data, start_row=None):
+    def add_data(self, data):
         """
-        Add data rows to the worksheet
+        Append data rows to the worksheet after the last existing row
         
         Args:
             data (list): List of dictionaries containing video data
-            start_row (int): Starting row number (optional, auto-calculated if None)
-        """
-        if start_row is None:
-            # Start after the last existing row
-            start_row = self.worksheet.max_row + 1
-        
-        for row, video in enumerate(data, start_row):
-            # Map video data to columns
-            self.worksheet.cell(row=row, column=1, value=video.get('url', ''))
-            self.worksheet.cell(row=row, column=2, value=video.get('username', ''))
-            self.worksheet.cell(row=row, column=3, value=video.get('video_id', ''))
-            self.worksheet.cell(row=row, column=4, value=video.get('title', ''))
-            self.worksheet.cell(row=row, column=5, value=video.get('search_query', ''))
-            self.worksheet.cell(row=row, column=6, value=video.get('added_date', ''))
+        """
+        self.add_rows(self._video_to_row(video) for video in data)
+    
+    def add_rows(self, rows):
+        """
+        Append already-mapped rows to the worksheet, one append call per row
+        
+        Args:
+            rows (iterable): Row value lists in header order
+        """
+        append = self.worksheet.append
+        for row in rows:
+            append(row)
+    
+    def _video_to_row(self, video):
+        """
+        Map a video dictionary to its worksheet row values
+        
+        Args:
+            video (dict): Video data
+            
+        Returns:
+            list: Row values in header order
+        """
+        return [
+            # Stripped the same way as in filter_duplicate_videos
+            (video.get('url') or '').strip(),
+            video.get('username', ''),
+            video.get('video_id', ''),
+            video.get('title', ''),
+            video.get('search_query', ''),
+            video.get('added_date', '')
+        ]
     
-    def auto_adjust_columns(self, max_width=None):
+    def auto_adjust_columns(self, max_width=None, new_rows=None):
         """
         Automatically adjust column widths based on content
         
+        When new_rows is given and the workbook carries cached widths from a
+        previous save, only the new rows are measured. Otherwise the whole
+        worksheet is scanned.
+        
         Args:
             max_width (int): Maximum column width (optional)
+            new_rows (list): Row value lists added since the last save (optional)
         """
+        from openpyxl.utils import get_column_letter
+        
         if max_width is None:
             max_width = EXCEL_CONFIG["max_column_width"]
         
-        for column in self.worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
+        widths = self._load_column_widths() if new_rows is not None else None
+        if widths is None:
+            widths = self._measure_columns(self.worksheet.iter_rows(min_row=1, values_only=True))
+        else:
+            widths = self._measure_columns(new_rows, widths)
+        
+        for index, width in enumerate(widths, 1):
+            self.worksheet.column_dimensions[get_column_letter(index)].width = min(width + 2, max_width)
+        
+        self._store_column_widths(widths)
+    
+    def _measure_columns(self, rows, widths=None):
+        """
+        Measure the widest value in each column of the given rows
+        
+        Args:
+            rows (iterable): Row value sequences
+            widths (list): Widths measured so far, extended in place (optional)
             
-            adjusted_width = min(max_length + 2, max_width)
-            self.worksheet.column_dimensions[column_letter].width = adjusted_width
+        Returns:
+            list: Raw content width of each column
+        """
+        if widths is None:
+            widths = []
+        
+        # Single pass over raw row values, tracking the widest value per column
+        for row in rows:
+            if len(row) > len(widths):
+                widths.extend([0] * (len(row) - len(widths)))
+            for index, value in enumerate(row):
+                # Empty cells don't count (str(None) would measure as 4)
+                if value is None:
+                    continue
+                length = len(value) if type(value) is str else len(str(value))
+                if length > widths[index]:
+                    widths[index] = length
+        
+        return widths
+    
+    def _load_column_widths(self):
+        """
+        Read cached column widths from the workbook's hidden defined name
+        
+        Returns:
+            list: Column widths, or None if missing or unreadable
+        """
+        defined_name = self.workbook.defined_names.get(COLUMN_WIDTHS_NAME)
+        if defined_name is None or not defined_name.attr_text:
+            return None
+        try:
+            return [int(width) for width in defined_name.attr_text.strip('"').split(',')]
+        except ValueError:
+            return None
+    
+    def _store_column_widths(self, widths):
+        """
+        Cache column widths in a hidden defined name for the next append
+        
+        Args:
+            widths (list): Raw content width of each column
+        """
+        from openpyxl.workbook.defined_name import DefinedName
+        
+        value = ','.join(str(width) for width in widths)
+        self.workbook.defined_names[COLUMN_WIDTHS_NAME] = DefinedName(
+            COLUMN_WIDTHS_NAME, attr_text=f'"{value}"', hidden=True
+        )
     
     def save_workbook(self, filename):
         """
@@ -176,18 +337,29 @@ class ExcelManager:
             bool: True if save successful, False otherwise
         """
         try:
-            # Ensure the directory exists
-            directory = os.path.dirname(filename)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                print(f"📁 Created directory: {directory}")
+            self._ensure_directory(filename)
             
             self.workbook.save(filename)
+            
+            # Written after the workbook so its mtime marks it as up to date
+            self._save_links_cache(filename)
             return True
         except Exception as e:
             print(f"❌ Error saving Excel file: {e}")
             return False
     
+    def _ensure_directory(self, filename):
+        """
+        Create the directory for an output file if it doesn't exist
+        
+        Args:
+            filename (str): Output filename
+        """
+        directory = os.path.dirname(filename)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+            print(f"📁 Created directory: {directory}")
+    
     def create_and_save(self, videos, filename, headers=None):
         """
         Create workbook, add data, and save in one operation
@@ -210,43 +382,156 @@ class ExcelManager:
             # Try to load existing workbook first
             file_exists = self.load_existing_workbook(filename)
             
-            if not file_exists:
-                # Create new workbook and worksheet
-                self.create_workbook()
-            
-            # Add headers (only if new file)
-            if not file_exists:
-                self.add_headers(headers)
-            
             # Filter out duplicate videos
             new_videos, duplicate_count = self.filter_duplicate_videos(videos)
             
             if duplicate_count > 0:
                 print(f"⚠️  Skipped {duplicate_count} duplicate links")
             
-            if new_videos:
-                # Add new data
-                self.add_data(new_videos)
-                
-                # Auto-adjust columns
-                self.auto_adjust_columns()
-                
-                # Save file
-                if self.save_workbook(filename):
-                    print(MESSAGES["saved"].format(filename=filename))
-                    print(f"📊 Added {len(new_videos)} new links to existing file")
-                    print(f"📈 Total links in file: {len(self.existing_links)}")
-                    return True
-                else:
-                    return False
-            else:
+            if not new_videos:
+                # Nothing to write - skip the full workbook parse entirely
                 print("ℹ️  All videos already exist in the file - no new data added")
                 return True
+            
+            # New files are streamed without keeping cells in memory
+            if not file_exists:
+                return self._save_write_only(new_videos, filename, headers)
+            
+            # Full (writable) parse only once there is data to append
+            self.open_workbook_for_append(filename)
+            
+            # Map the videos to rows once, for both writing and width measuring
+            new_rows = [self._video_to_row(video) for video in new_videos]
+            self.add_rows(new_rows)
+            
+            # Auto-adjust columns (appends only measure the new rows)
+            self.auto_adjust_columns(new_rows=new_rows)
+            
+            # Save file
+            if self.save_workbook(filename):
+                print(MESSAGES["saved"].format(filename=filename))
+                print(f"📊 Added {len(new_videos)} new links to existing file")
+                print(f"📈 Total links in file: {len(self.existing_links)}")
+                return True
+            else:
+                return False
                 
         except Exception as e:
             print(f"❌ Error creating Excel file: {e}")
             return False
     
+    def _save_write_only(self, videos, filename, headers=None):
+        """
+        Save a new file by streaming rows instead of holding cells in memory
+        
+        Uses xlsxwriter (constant-memory mode) when it is installed, otherwise
+        openpyxl's write-only mode. Streamed sheets can't be scanned, so column
+        widths are measured from the rows up front and set before the first row.
+        
+        Args:
+            videos (list): List of video dictionaries (already de-duplicated)
+            filename (str): Output filename
+            headers (list): Custom headers (optional)
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if headers is None:
+            headers = EXCEL_CONFIG["headers"]
+        
+        rows = [self._video_to_row(video) for video in videos]
+        widths = self._measure_columns(rows, self._measure_columns([headers]))
+        
+        try:
+            import xlsxwriter
+        except ImportError:
+            xlsxwriter = None
+        
+        if xlsxwriter is not None:
+            saved = self._write_rows_xlsxwriter(xlsxwriter, filename, headers, rows, widths)
+        else:
+            saved = self._write_rows_openpyxl(filename, headers, rows, widths)
+        
+        if saved:
+            print(MESSAGES["saved"].format(filename=filename))
+            print(f"📊 Added {len(videos)} new links to new file")
+            print(f"📈 Total links in file: {len(self.existing_links)}")
+            return True
+        return False
+    
+    def _write_rows_openpyxl(self, filename, headers, rows, widths):
+        """
+        Write a new file with openpyxl's write-only mode
+        
+        Args:
+            filename (str): Output filename
+            headers (list): Header row
+            rows (list): Row value lists
+            widths (list): Raw content width of each column
+            
+        Returns:
+            bool: True if save successful, False otherwise
+        """
+        import openpyxl
+        from openpyxl.utils import get_column_letter
+        
+        max_width = EXCEL_CONFIG["max_column_width"]
+        
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet(EXCEL_CONFIG["sheet_name"])
+        
+        # Column widths must be set before the first row is written
+        for index, width in enumerate(widths, 1):
+            self.worksheet.column_dimensions[get_column_letter(index)].width = min(width + 2, max_width)
+        self._store_column_widths(widths)
+        
+        self.worksheet.append(headers)
+        for row in rows:
+            self.worksheet.append(row)
+        
+        return self.save_workbook(filename)
+    
+    def _write_rows_xlsxwriter(self, xlsxwriter, filename, headers, rows, widths):
+        """
+        Write a new file with xlsxwriter, flushing each row to disk as it goes
+        
+        Args:
+            xlsxwriter (module): The imported xlsxwriter module
+            filename (str): Output filename
+            headers (list): Header row
+            rows (list): Row value lists
+            widths (list): Raw content width of each column
+            
+        Returns:
+            bool: True if save successful, False otherwise
+        """
+        max_width = EXCEL_CONFIG["max_column_width"]
+        
+        try:
+            self._ensure_directory(filename)
+            
+            workbook = xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_urls': False})
+            worksheet = workbook.add_worksheet(EXCEL_CONFIG["sheet_name"])
+            
+            for index, width in enumerate(widths):
+                worksheet.set_column(index, index, min(width + 2, max_width))
+            # Same hidden cache openpyxl saves get, so later appends stay incremental
+            value = ','.join(str(width) for width in widths)
+            if workbook.define_name(COLUMN_WIDTHS_NAME, f'="{value}"') == 0:
+                # define_name() has no hidden option; entries are [name, sheet, formula, hidden]
+                workbook.defined_names[-1][3] = True
+            
+            worksheet.write_row(0, 0, headers)
+            for row_index, row in enumerate(rows, 1):
+                worksheet.write_row(row_index, 0, row)
+            workbook.close()
+            
+            self._save_links_cache(filename)
+            return True
+        except Exception as e:
+            print(f"❌ Error saving Excel file: {e}")
+            return False
+    
     def cleanup(self):
         """Clean up workbook resources"""
         if self.workbook:
@@ -6,7 +6,15 @@ Handles authentication state, login prompts, and session management for TikTok s
 import time
 import json
 import os
+import atexit
+import threading
 from pathlib import Path
+
+try:
+    import orjson  # Optional: faster, more compact session file (de)serialization
+except ImportError:
+    orjson = None
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -14,9 +22,23 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
+from src.managers.browser_manager import CHROME_BASE_ARGS, collect_video_links, get_chromedriver_path, set_resource_blocking
 from src.core.config import BROWSER_CONFIG, MESSAGES
 
+# Either link means the TikTok page has rendered enough to inspect the login state
+PAGE_READY_SELECTOR = "a[href*='/login'], a[href*='/@']"  # Login link, profile link
+
+# True if the page offers a visible login link/button (i.e. the user is logged out).
+# Profile links and avatars can't tell the states apart: the logged-out feed is full of them.
+LOGIN_PROMPT_SCRIPT = """
+const isVisible = (el) => el.getClientRects().length > 0;
+if (Array.from(document.querySelectorAll("a[href*='/login'], button[data-e2e='top-login-button'], div[class*='login']")).some(isVisible)) return true;
+return Array.from(document.querySelectorAll('button')).some(b => isVisible(b) && b.textContent.includes('Log in'));
+"""
+
+SCROLL_HEIGHT_SCRIPT = "return document.body.scrollHeight"
+
 
 class TikTokLoginManager:
     """
@@ -36,8 +58,23 @@ class TikTokLoginManager:
         else:
             # User chose not to login, continue with limited results
             videos = searcher.search_tiktok(query)
+    
+    One Chrome process is shared by all instances in the process, so later
+    logins and searches skip the browser cold start. It is closed once unused
+    for BROWSER_CONFIG["login_idle_timeout"], at exit, or by cleanup(force=True).
     """
     
+    # Browser shared across instances. _shared_lock guards these fields.
+    # The lease (guarded by _lease_cond) names the thread currently driving the
+    # browser and the instance in it that holds the lease (by token).
+    _shared_driver = None
+    _shared_lock = threading.Lock()
+    _lease_cond = threading.Condition()
+    _lease_thread = None
+    _lease_token = None
+    _idle_timer = None
+    _atexit_registered = False
+    
     def __init__(self, session_file="tiktok_session.json"):
         """
         Initialize the login manager
@@ -47,6 +84,7 @@ class TikTokLoginManager:
         """
         self.session_file = session_file
         self.driver = None
+        self._lease_token = None
         self.is_logged_in = False
         self.session_data = self._load_session()
         
@@ -59,8 +97,8 @@ class TikTokLoginManager:
         """
         try:
             if os.path.exists(self.session_file):
-                with open(self.session_file, 'r') as f:
-                    return json.load(f)
+                data = Path(self.session_file).read_bytes()
+                return orjson.loads(data) if orjson else json.loads(data)
         except Exception as e:
             print(f"⚠️  Warning: Could not load session data: {e}")
         return {}
@@ -68,56 +106,173 @@ class TikTokLoginManager:
     def _save_session(self):
         """Save current session data to file"""
         try:
-            with open(self.session_file, 'w') as f:
-                json.dump(self.session_data, f)
+            if orjson:
+                Path(self.session_file).write_bytes(orjson.dumps(self.session_data))
+            else:
+                with open(self.session_file, 'w') as f:
+                    json.dump(self.session_data, f)
         except Exception as e:
             print(f"⚠️  Warning: Could not save session data: {e}")
     
     def _setup_driver(self):
-        """Setup Chrome driver for login operations"""
+        """
+        Setup Chrome driver for login operations, reusing the shared browser if it is still open
+        
+        Blocks while a search on another thread is using the shared browser;
+        the lease is held until cleanup().
+        
+        Returns:
+            bool: True if a driver is ready, False otherwise
+        """
+        cls = TikTokLoginManager
+        self._acquire_lease()
+        
+        with cls._shared_lock:
+            cls._cancel_idle_timer()
+            if cls._shared_driver is not None:
+                if cls._is_driver_alive(cls._shared_driver):
+                    print("♻️  Reusing open Chrome browser")
+                    self.driver = cls._shared_driver
+                    return True
+                # The user closed the window (or Chrome crashed) - start over
+                cls._quit_shared_driver()
+            
+            started = self._start_driver()
+            if started:
+                cls._shared_driver = self.driver
+                if not cls._atexit_registered:
+                    atexit.register(cls.shutdown_shared_driver)
+                    cls._atexit_registered = True
+        
+        if not started:
+            self._release_lease()
+        return started
+    
+    def _acquire_lease(self):
+        """
+        Take the lease on the shared browser, waiting for other threads' searches
+        
+        Within one thread the lease simply passes to the newest instance, so an
+        instance dropped without cleanup() can't block the next one.
+        """
+        cls = TikTokLoginManager
+        if self._lease_token is not None and cls._lease_token is self._lease_token:
+            return
+        
+        thread_id = threading.get_ident()
+        with cls._lease_cond:
+            while cls._lease_token is not None and cls._lease_thread != thread_id:
+                cls._lease_cond.wait()
+            self._lease_token = object()
+            cls._lease_token = self._lease_token
+            cls._lease_thread = thread_id
+    
+    def _release_lease(self):
+        """Hand the shared browser back and start its idle shutdown countdown"""
+        cls = TikTokLoginManager
+        token, self._lease_token = self._lease_token, None
+        if token is None:
+            return
+        
+        with cls._lease_cond:
+            # A newer instance in the same thread may have taken the lease over
+            if cls._lease_token is not token:
+                return
+            cls._lease_token = None
+            cls._lease_thread = None
+            cls._lease_cond.notify()
+        
+        with cls._shared_lock:
+            if cls._shared_driver is not None:
+                cls._schedule_idle_shutdown()
+    
+    @staticmethod
+    def _is_driver_alive(driver):
+        """
+        Check whether a driver's browser still has an open window
+        
+        Args:
+            driver: Selenium WebDriver instance
+            
+        Returns:
+            bool: True if the browser is usable, False otherwise
+        """
+        try:
+            return driver.service.is_connectable() and bool(driver.window_handles)
+        except Exception:
+            return False
+    
+    @classmethod
+    def _quit_shared_driver(cls):
+        """Quit the shared browser (caller must hold _shared_lock)"""
+        driver, cls._shared_driver = cls._shared_driver, None
+        if driver:
+            try:
+                driver.quit()
+                print("✅ Login manager browser closed")
+            except Exception as e:
+                print(f"⚠️  Error closing login manager browser: {e}")
+    
+    @classmethod
+    def shutdown_shared_driver(cls):
+        """Close the shared browser, if one is running"""
+        with cls._shared_lock:
+            cls._cancel_idle_timer()
+            cls._quit_shared_driver()
+    
+    @classmethod
+    def _shutdown_if_idle(cls):
+        """Close the shared browser unless a search has leased it since the timer started"""
+        with cls._lease_cond:
+            if cls._lease_token is None:
+                cls.shutdown_shared_driver()
+    
+    @classmethod
+    def _schedule_idle_shutdown(cls):
+        """(Re)start the idle timer that closes the shared browser (caller must hold _shared_lock)"""
+        cls._cancel_idle_timer()
+        cls._idle_timer = threading.Timer(BROWSER_CONFIG["login_idle_timeout"], cls._shutdown_if_idle)
+        cls._idle_timer.daemon = True
+        cls._idle_timer.start()
+    
+    @classmethod
+    def _cancel_idle_timer(cls):
+        """Cancel a pending idle shutdown (caller must hold _shared_lock)"""
+        if cls._idle_timer:
+            cls._idle_timer.cancel()
+            cls._idle_timer = None
+    
+    def _start_driver(self):
+        """Start a new Chrome driver for login operations"""
         try:
             print("🔧 Setting up Chrome browser...")
             chrome_options = Options()
             
-            # Apply browser configuration with security in mind
-            if BROWSER_CONFIG["no_sandbox"]:
-                chrome_options.add_argument("--no-sandbox")
-            if BROWSER_CONFIG["disable_dev_shm_usage"]:
-                chrome_options.add_argument("--disable-dev-shm-usage")
-            if BROWSER_CONFIG["disable_gpu"]:
-                chrome_options.add_argument("--disable-gpu")
-            
-            # Add security and compatibility options to make Chrome more secure
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+            # Same switches as the search browser; login stays visible and loads images
+            for arg in CHROME_BASE_ARGS:
+                chrome_options.add_argument(arg)
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
             
-            chrome_options.add_argument(f"--window-size={BROWSER_CONFIG['window_size']}")
-            chrome_options.add_argument(f"--user-agent={BROWSER_CONFIG['user_agent']}")
+            # Return from driver.get() at DOMContentLoaded; readiness is checked with explicit waits
+            chrome_options.page_load_strategy = BROWSER_CONFIG["page_load_strategy"]
             
             # Don't run headless during login for better user experience
             # chrome_options.add_argument("--headless")
             
             print("📥 Installing Chrome driver...")
             # Install and setup Chrome driver
-            service = Service(ChromeDriverManager().install())
+            service = Service(get_chromedriver_path())
             print("🚀 Starting Chrome browser...")
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Probes must fail fast; waiting is done explicitly with WebDriverWait
+            self.driver.implicitly_wait(0)
             print("✅ Chrome browser started successfully!")
             
             # Load saved cookies if available
             if self.session_data.get('cookies'):
                 print("🍪 Loading saved session cookies...")
-                self.driver.get("https://www.tiktok.com")
-                for cookie in self.session_data['cookies']:
-                    try:
-                        self.driver.add_cookie(cookie)
-                    except Exception as e:
-                        print(f"⚠️  Warning: Could not load cookie: {e}")
+                self._restore_cookies(self.session_data['cookies'])
             
             return True
             
@@ -126,6 +281,59 @@ class TikTokLoginManager:
             print("💡 Make sure Chrome browser is installed on your system")
             return False
     
+    def _restore_cookies(self, cookies):
+        """
+        Install saved cookies in the browser with a single CDP command
+        
+        Falls back to one add_cookie() call per cookie if CDP is unavailable.
+        
+        Args:
+            cookies (list): Cookie dictionaries as returned by driver.get_cookies()
+        """
+        cdp_cookies = [
+            {
+                **{key: value for key, value in cookie.items() if key != 'expiry'},
+                **({'expires': cookie['expiry']} if 'expiry' in cookie else {}),
+                'domain': cookie.get('domain') or '.tiktok.com',
+            }
+            for cookie in cookies
+        ]
+        try:
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+            return
+        except Exception as e:
+            print(f"⚠️  Warning: Bulk cookie restore failed, loading one by one: {e}")
+        
+        # add_cookie() requires being on the cookie's domain
+        self.driver.get("https://www.tiktok.com")
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                print(f"⚠️  Warning: Could not load cookie: {e}")
+    
+    def _wait_for_page_ready(self, timeout=None):
+        """
+        Wait until the current TikTok page shows a login or profile link
+        
+        Args:
+            timeout (int): Maximum seconds to wait (optional, defaults to config)
+            
+        Returns:
+            bool: True if the page became ready, False on timeout
+        """
+        if timeout is None:
+            timeout = BROWSER_CONFIG["page_ready_timeout"]
+        
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PAGE_READY_SELECTOR))
+            )
+            return True
+        except TimeoutException:
+            print("⚠️  Page did not finish loading before timeout, continuing...")
+            return False
+    
     def check_login_status(self):
         """
         Check if user is currently logged into TikTok
@@ -141,48 +349,23 @@ class TikTokLoginManager:
             # Navigate to TikTok homepage
             print("🔍 Checking login status...")
             self.driver.get("https://www.tiktok.com")
-            time.sleep(3)
-            
-            # Look for login indicators
-            login_indicators = [
-                "//a[contains(@href, '/login')]",  # Login link
-                "//button[contains(text(), 'Log in')]",  # Login button
-                "//div[contains(@class, 'login')]",  # Login container
-            ]
-            
-            # Look for logged-in indicators
-            logged_in_indicators = [
-                "//a[contains(@href, '/@')]",  # Profile link
-                "//div[contains(@class, 'avatar')]",  # Avatar
-                "//button[contains(@class, 'profile')]",  # Profile button
-            ]
-            
-            # Check for logged-in indicators first
-            for indicator in logged_in_indicators:
-                try:
-                    element = self.driver.find_element(By.XPATH, indicator)
-                    if element.is_displayed():
-                        print("✅ User is logged into TikTok")
-                        self.is_logged_in = True
-                        return True
-                except:
-                    continue
+            self._wait_for_page_ready()
             
-            # Check for login indicators
-            for indicator in login_indicators:
-                try:
-                    element = self.driver.find_element(By.XPATH, indicator)
-                    if element.is_displayed():
-                        print("❌ User is not logged into TikTok")
-                        self.is_logged_in = False
-                        return False
-                except:
-                    continue
+            # A visible login prompt means logged out, whatever else is on the page
+            if self.driver.execute_script(LOGIN_PROMPT_SCRIPT):
+                print("❌ User is not logged into TikTok")
+                self.is_logged_in = False
+                return False
             
-            # If we can't determine, assume not logged in
-            print("❓ Could not determine login status, assuming not logged in")
-            self.is_logged_in = False
-            return False
+            # TikTok drops the session cookie when it no longer accepts the session
+            if self._login_cookie_value() is None:
+                print("❓ No TikTok session cookie, assuming not logged in")
+                self.is_logged_in = False
+                return False
+            
+            print("✅ User is logged into TikTok")
+            self.is_logged_in = True
+            return True
             
         except Exception as e:
             print(f"❌ Error checking login status: {e}")
@@ -231,17 +414,21 @@ class TikTokLoginManager:
             else:
                 print("✅ Browser already initialized")
             
+            # Cookies restored from a stale session may already hold a login cookie;
+            # only a new or changed value means the user has just logged in
+            previous_cookie = self._login_cookie_value()
+            
             # Navigate to TikTok login page
             print("🌐 Navigating to TikTok login page...")
             self.driver.get("https://www.tiktok.com/login")
-            time.sleep(3)
+            self._wait_for_page_ready()
             print("✅ TikTok login page loaded")
             
             # Check if we're in GUI mode
             if self._is_gui_mode():
                 return self._perform_gui_login()
             else:
-                return self._perform_cli_login()
+                return self._perform_cli_login(previous_cookie)
             
         except Exception as e:
             print(f"❌ Error during login process: {e}")
@@ -288,26 +475,22 @@ class TikTokLoginManager:
             print("❌ If you want to cancel, close the browser window")
             print("="*60)
             
-            # For GUI mode, we'll use a simpler approach
-            # Wait for user to complete login by checking login status periodically
+            # Wait for user to complete login, polling the page every half second
+            # and reporting progress every few seconds
             max_wait_time = 300  # 5 minutes max wait
-            check_interval = 5   # Check every 5 seconds
+            check_interval = 5   # Progress update every 5 seconds
             elapsed_time = 0
             
             while elapsed_time < max_wait_time:
-                time.sleep(check_interval)
-                elapsed_time += check_interval
-                
-                # Check if user is logged in
-                if self._check_login_status_quick():
+                try:
+                    WebDriverWait(self.driver, check_interval, poll_frequency=0.5).until(
+                        lambda driver: self._check_login_status_quick()
+                    )
                     print("✅ Login detected! Proceeding with search...")
-                    
-                    # Save session data
-                    self.session_data['cookies'] = self.driver.get_cookies()
-                    self.session_data['login_time'] = time.time()
-                    self._save_session()
-                    
+                    self._store_session()
                     return True
+                except TimeoutException:
+                    elapsed_time += check_interval
                 
                 # Show progress
                 remaining = max_wait_time - elapsed_time
@@ -346,31 +529,23 @@ class TikTokLoginManager:
             if 'login' in current_url.lower():
                 return False
             
-            # Try to find logged-in indicators
-            try:
-                # Look for profile or user elements
-                profile_elements = self.driver.find_elements("xpath", "//a[contains(@href, '/@')]")
-                if profile_elements:
-                    return True
-                
-                # Look for user menu or avatar
-                user_elements = self.driver.find_elements("xpath", "//div[contains(@class, 'avatar') or contains(@class, 'profile')]")
-                if user_elements:
-                    return True
-                    
-            except:
-                pass
-            
-            return False
+            # Same rule as check_login_status(): no login prompt and a session cookie
+            if self.driver.execute_script(LOGIN_PROMPT_SCRIPT):
+                return False
+            return self._login_cookie_value() is not None
             
         except Exception as e:
             print(f"⚠️  Error checking login status: {e}")
             return False
     
-    def _perform_cli_login(self):
+    def _perform_cli_login(self, previous_cookie=None):
         """
         Perform login in CLI mode using input()
         
+        Args:
+            previous_cookie (str): Login cookie value present before the login page
+                was opened, which doesn't count as a login (optional)
+        
         Returns:
             bool: True if login successful, False otherwise
         """
@@ -378,22 +553,24 @@ class TikTokLoginManager:
         print("⏳ WAITING FOR YOU TO COMPLETE LOGIN/REGISTRATION")
         print("="*60)
         print("📝 Please complete your login or registration in the browser")
-        print("💡 The tool will wait as long as you need")
+        print("✅ Login is detected automatically - the search continues as soon as you're in")
+        print("="*60)
+        
+        if self._wait_for_login_cookie(previous_cookie):
+            print("✅ Login detected! Proceeding with search...")
+            self._store_session()
+            return True
+        
+        print("❓ Could not detect the login automatically")
         print("✅ When you're fully logged in, come back here and type 'Y'")
         print("❌ If you want to cancel, type 'N'")
-        print("="*60)
         
         while True:
             confirmation = input("\n🤔 Did you log in to your account? (Y/N): ").strip().upper()
             
             if confirmation == 'Y':
                 print("✅ Confirmed! Proceeding with search...")
-                
-                # Save session data
-                self.session_data['cookies'] = self.driver.get_cookies()
-                self.session_data['login_time'] = time.time()
-                self._save_session()
-                
+                self._store_session()
                 return True
                     
             elif confirmation == 'N':
@@ -403,6 +580,48 @@ class TikTokLoginManager:
             else:
                 print("❌ Please enter 'Y' for yes or 'N' for no")
     
+    def _wait_for_login_cookie(self, previous_cookie=None):
+        """
+        Wait until the browser holds a fresh TikTok login cookie or is already logged in
+        
+        A restored cookie that TikTok still accepts never changes, so a logged-in
+        page (TikTok leaves /login, no login prompt, cookie set) also counts.
+        
+        Args:
+            previous_cookie (str): Cookie value that doesn't count on its own, e.g. one
+                restored from an expired saved session (optional)
+        
+        Returns:
+            bool: True as soon as the user is logged in, False on timeout
+        """
+        try:
+            WebDriverWait(self.driver, BROWSER_CONFIG["login_cookie_timeout"], poll_frequency=0.5).until(
+                lambda driver: self._login_cookie_value() not in (None, previous_cookie)
+                or self._check_login_status_quick()
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _login_cookie_value(self):
+        """
+        Get the value of TikTok's login cookie in the browser
+        
+        Returns:
+            str: Cookie value, or None if the cookie is missing or unreadable
+        """
+        try:
+            cookie = self.driver.get_cookie(BROWSER_CONFIG["login_cookie_name"])
+        except Exception:
+            return None
+        return cookie.get('value') if cookie else None
+    
+    def _store_session(self):
+        """Save the browser's current cookies as the logged-in session"""
+        self.session_data['cookies'] = self.driver.get_cookies()
+        self.session_data['login_time'] = time.time()
+        self._save_session()
+    
     def ensure_login(self):
         """
         Ensure user is logged in, prompting if necessary
@@ -410,9 +629,26 @@ class TikTokLoginManager:
         Returns:
             bool: True if logged in (either already or after prompt), False if user chose not to login
         """
-        # Always prompt for login confirmation, don't auto-check
+        # A recent saved session skips the login page if TikTok still accepts it.
+        # The browser restores the saved cookies on start; check_login_status() then
+        # requires no login prompt on the homepage and the session cookie still set.
+        if self._has_recent_saved_session() and self.check_login_status():
+            print("✅ Using saved TikTok session")
+            return True
+        
         return self.prompt_for_login()
     
+    def _has_recent_saved_session(self):
+        """
+        Check whether saved session cookies exist and are younger than session_max_age
+        
+        Returns:
+            bool: True if the saved session is worth trying, False otherwise
+        """
+        cookies = self.session_data.get('cookies')
+        login_time = self.session_data.get('login_time', 0)
+        return bool(cookies) and time.time() - login_time < BROWSER_CONFIG["session_max_age"]
+    
     def get_login_status_message(self):
         """
         Get a user-friendly message about current login status
@@ -425,14 +661,20 @@ class TikTokLoginManager:
         else:
             return "❌ Not logged in - Limited to 6 search results"
     
-    def cleanup(self):
-        """Clean up browser resources"""
-        if self.driver:
-            try:
-                self.driver.quit()
-                print("✅ Login manager browser closed")
-            except Exception as e:
-                print(f"⚠️  Error closing login manager browser: {e}")
+    def cleanup(self, force=False):
+        """
+        Clean up browser resources
+        
+        Releases the shared browser for the next login/search. Unless forced, it
+        stays open until it has been unused for BROWSER_CONFIG["login_idle_timeout"].
+        
+        Args:
+            force (bool): Close the shared browser now instead of after the idle timeout
+        """
+        self.driver = None
+        if force:
+            TikTokLoginManager.shutdown_shared_driver()
+        self._release_lease()
     
     def __enter__(self):
         """Context manager entry"""
@@ -441,6 +683,13 @@ class TikTokLoginManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup"""
         self.cleanup()
+    
+    def __del__(self):
+        """Give the browser lease back if this instance is dropped without cleanup()"""
+        try:
+            self._release_lease()
+        except Exception:
+            pass
 
 
 class TikTokSearchWithLogin:
@@ -486,9 +735,10 @@ class TikTokSearchWithLogin:
             print("✅ Login successful - full search results available")
         
         # Use the same browser instance for search
+        driver = None
         try:
             # Import and use the search functionality with the existing browser
-            from src.utils.utils import build_search_url, find_tiktok_links, extract_video_info, format_progress
+            from src.utils.utils import build_search_url
             from src.core.config import SEARCH_CONFIG, MESSAGES
             
             print(MESSAGES["searching"].format(query=query))
@@ -509,59 +759,67 @@ class TikTokSearchWithLogin:
             # Build search URL
             search_url = build_search_url(query)
             
+            # Login is done - skip media, fonts and analytics while scraping
+            set_resource_blocking(driver, True)
+            
             # Navigate to search page in the same browser
             print(f"🌐 Navigating to search page: {search_url}")
             driver.get(search_url)
             
             # Wait for dynamic content
             print("⏳ Waiting for TikTok content to load...")
-            time.sleep(SEARCH_CONFIG["dynamic_content_wait"])
+            self._wait_for_video_cards(driver)
             
             # Scroll to load more content
             if scroll_count is None:
                 scroll_count = SEARCH_CONFIG["default_scroll_count"]
             
+            max_limit = SEARCH_CONFIG["max_results_limit"]
+            
+            # Links are collected as we scroll, so videos dropped from the DOM are kept
+            unique_links = []
+            seen_links = set()
+            
+            def collect_links():
+                new_links = [link for link in collect_video_links(driver) if link not in seen_links]
+                seen_links.update(new_links)
+                unique_links.extend(new_links)
+                return len(new_links)
+            
+            collect_links()
+            
             print(f"📜 Starting to scroll to load more videos... ({scroll_count} scrolls)")
             for i in range(scroll_count):
                 print(f"📜 Scroll {i+1}/{scroll_count} - Loading more videos...")
+                last_height = driver.execute_script(SCROLL_HEIGHT_SCRIPT)
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(SEARCH_CONFIG["scroll_pause"])
+                
+                # Wait for the feed to grow; a plateau means nothing more to load
+                if not self._wait_for_feed_growth(driver, last_height):
+                    print(f"ℹ️  No new content after scroll {i+1} - stopping early")
+                    break
                 print(f"✅ Scroll {i+1} completed - waiting for content to load...")
+                
+                new_count = collect_links()
+                if len(unique_links) >= max_limit:
+                    print(f"ℹ️  Reached {max_limit} links - stopping early")
+                    break
+                if new_count < SEARCH_CONFIG["scroll_min_new_links"]:
+                    print(f"ℹ️  Scroll {i+1} found no new videos - stopping early")
+                    break
             
             print("🎯 Finished scrolling - all available videos should be loaded")
             
-            # Get page source
-            page_source = driver.page_source
-            
-            # Extract video links
-            print(MESSAGES["extracting"])
-            unique_links = find_tiktok_links(page_source)
-            
             print(MESSAGES["found_links"].format(count=len(unique_links)))
             
             if unique_links:
                 # Apply safety limit to prevent excessive results
-                max_limit = SEARCH_CONFIG["max_results_limit"]
                 if len(unique_links) > max_limit:
                     print(f"⚠️  Found {len(unique_links)} links, limiting to {max_limit} for safety")
                     unique_links = unique_links[:max_limit]
                 
-                # Extract additional info for each video
-                for i, link in enumerate(unique_links, 1):
-                    progress = format_progress(i, len(unique_links))
-                    print(MESSAGES["processing"].format(current=i, total=len(unique_links)))
-                    
-                    # Extract username and video ID
-                    username, video_id = extract_video_info(link)
-                    
-                    video_info = {
-                        'url': link,
-                        'username': username,
-                        'video_id': video_id,
-                        'title': f"Video by @{username}",
-                        'search_query': query
-                    }
-                    videos.append(video_info)
+                print(MESSAGES["processing_batch"].format(count=len(unique_links)))
+                videos = self._build_videos(unique_links, query)
                 
                 print(MESSAGES["success"].format(count=len(videos)))
             else:
@@ -574,6 +832,75 @@ class TikTokSearchWithLogin:
         except Exception as e:
             print(f"❌ Error during search: {e}")
             return []
+        finally:
+            # The shared browser may be used for a login next
+            if driver:
+                set_resource_blocking(driver, False)
+    
+    def _wait_for_video_cards(self, driver):
+        """
+        Wait until the search page shows any video card
+        
+        Args:
+            driver: Selenium WebDriver showing the search results
+        """
+        from src.core.config import SEARCH_CONFIG
+        
+        conditions = [
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            for selector in SEARCH_CONFIG["video_card_selectors"]
+        ]
+        try:
+            WebDriverWait(driver, SEARCH_CONFIG["dynamic_content_wait"]).until(EC.any_of(*conditions))
+            # Short settle so the first batch of cards finishes rendering
+            time.sleep(SEARCH_CONFIG["dynamic_content_settle"])
+        except TimeoutException:
+            print("⚠️  No video cards detected before timeout, continuing...")
+    
+    def _wait_for_feed_growth(self, driver, last_height):
+        """
+        Wait for the page to grow past a previous scroll height
+        
+        Args:
+            driver: Selenium WebDriver showing the search results
+            last_height (int): Scroll height measured before scrolling
+            
+        Returns:
+            bool: True if new content loaded, False if the feed plateaued
+        """
+        from src.core.config import SEARCH_CONFIG
+        
+        try:
+            WebDriverWait(driver, SEARCH_CONFIG["scroll_pause"]).until(
+                lambda d: d.execute_script(SCROLL_HEIGHT_SCRIPT) > last_height
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _build_videos(self, links, query):
+        """
+        Build video dictionaries for a list of links
+        
+        Args:
+            links (list): TikTok video URLs
+            query (str): Search term the links were found for
+            
+        Returns:
+            list: List of video dictionaries
+        """
+        from src.utils.utils import extract_video_info_batch
+        
+        return [
+            {
+                'url': link,
+                'username': username,
+                'video_id': video_id,
+                'title': f"Video by @{username}",
+                'search_query': query
+            }
+            for link, (username, video_id) in zip(links, extract_video_info_batch(links))
+        ]
     
     def cleanup(self):
         """Clean up all resources"""
@@ -3,10 +3,18 @@ Utility functions for TikTok Search Tool
 Contains helper functions for common operations
 """
 
+import functools
 import re
 from urllib.parse import quote
 from src.core.config import TIKTOK_URL_PATTERNS
 
+# Precompiled patterns (these run for every video on every search)
+_SANITIZE_NONWORD = re.compile(r'[^\w\s-]')
+_SANITIZE_SEP = re.compile(r'[-\s]+')
+_VIDEO_URL = re.compile(r'https://www\.tiktok\.com/@([\w.-]+)/video/(\d+)')
+# All link patterns fused into one alternation so the page source is scanned once
+_TIKTOK_LINKS = re.compile("|".join(f"(?:{pattern})" for pattern in TIKTOK_URL_PATTERNS))
+
 
 def sanitize_filename(query):
     """
@@ -19,9 +27,9 @@ def sanitize_filename(query):
         str: A safe filename string
     """
     # Remove special characters except letters, numbers, spaces, and hyphens
-    safe_query = re.sub(r'[^\w\s-]', '', query).strip()
+    safe_query = _SANITIZE_NONWORD.sub('', query).strip()
     # Replace multiple spaces or hyphens with single underscore
-    safe_query = re.sub(r'[-\s]+', '_', safe_query)
+    safe_query = _SANITIZE_SEP.sub('_', safe_query)
     return safe_query
 
 
@@ -54,7 +62,7 @@ def extract_video_info(url):
     video_id = "unknown"
     
     # Pattern 1: Full TikTok URL
-    match = re.search(r'https://www\.tiktok\.com/@([\w.-]+)/video/(\d+)', url)
+    match = _VIDEO_URL.search(url)
     if match:
         username = match.group(1)
         video_id = match.group(2)
@@ -68,6 +76,19 @@ def extract_video_info(url):
     return username, video_id
 
 
+def extract_video_info_batch(urls):
+    """
+    Extract username and video ID from many TikTok URLs at once
+    
+    Args:
+        urls (list): TikTok video URLs
+        
+    Returns:
+        list: (username, video_id) tuples, one per URL
+    """
+    return [extract_video_info(url) for url in urls]
+
+
 def find_tiktok_links(page_source):
     """
     Extract TikTok video links from page source using multiple patterns
@@ -76,23 +97,105 @@ def find_tiktok_links(page_source):
         page_source (str): HTML page source
         
     Returns:
-        list: List of unique TikTok video URLs
+        list: List of unique TikTok video URLs, in page order
     """
-    found_links = []
-    
-    for pattern in TIKTOK_URL_PATTERNS:
-        matches = re.findall(pattern, page_source)
-        found_links.extend(matches)
+    database = _hyperscan_database()
+    if database is not None:
+        links = _scan_links_hyperscan(database, page_source)
+    else:
+        links = (_link_from_match(match) for match in _TIKTOK_LINKS.finditer(page_source))
     
     # Remove duplicates while preserving order
-    unique_links = []
-    seen = set()
-    for link in found_links:
-        if link not in seen:
-            unique_links.append(link)
-            seen.add(link)
-    
-    return unique_links
+    return list(dict.fromkeys(links))
+
+
+def _link_from_match(match):
+    """
+    Get the URL from a fused-pattern match
+    
+    Patterns with a capture group contribute the captured URL only.
+    
+    Args:
+        match (re.Match): Match of _TIKTOK_LINKS
+        
+    Returns:
+        str: The matched URL
+    """
+    return match.group(match.lastindex) if match.lastindex else match.group(0)
+
+
+@functools.lru_cache(maxsize=None)
+def _hyperscan_database():
+    """
+    Compile TIKTOK_URL_PATTERNS into a hyperscan database, if hyperscan is installed
+    
+    Returns:
+        hyperscan.Database or None: Compiled database, or None to use the re scanner
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode() for pattern in TIKTOK_URL_PATTERNS],
+            ids=list(range(len(TIKTOK_URL_PATTERNS))),
+            elements=len(TIKTOK_URL_PATTERNS),
+            # UTF8 + UCP give \w and \d Unicode meaning, as in Python's re
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP]
+            * len(TIKTOK_URL_PATTERNS),
+        )
+        return database
+    except Exception as e:
+        print(f"⚠️  Could not compile hyperscan patterns, using re instead: {e}")
+        return None
+
+
+def _scan_links_hyperscan(database, page_source):
+    """
+    Find TikTok links with a single hyperscan pass over the page source
+    
+    hyperscan only reports byte offsets (and one event per possible end), so
+    each distinct start is mapped to its character offset and resolved with
+    _TIKTOK_LINKS, skipping starts that fall inside a link already taken.
+    
+    The result equals _TIKTOK_LINKS.finditer() with one exception: hyperscan's
+    Unicode tables are older than Python's, so a username containing a
+    character added in a recent Unicode version (e.g. U+0560) is not seen as a
+    word character by hyperscan and that link is missed.
+    
+    Args:
+        database (hyperscan.Database): Database from _hyperscan_database()
+        page_source (str): HTML page source
+        
+    Returns:
+        list: TikTok video URLs in page order (may contain duplicates)
+    """
+    data = page_source.encode('utf-8')
+    starts = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        starts.add(start)
+    
+    database.scan(data, match_event_handler=on_match)
+    
+    links = []
+    consumed_until = 0
+    byte_position = 0
+    char_position = 0
+    for start in sorted(starts):
+        # Matches start with an ASCII character, so start is on a character boundary
+        char_position += len(data[byte_position:start].decode('utf-8'))
+        byte_position = start
+        if char_position < consumed_until:
+            continue
+        match = _TIKTOK_LINKS.match(page_source, char_position)
+        if match:
+            links.append(_link_from_match(match))
+            consumed_until = match.end()
+    return links
 
 
 def build_search_url(query):
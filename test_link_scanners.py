@@ -0,0 +1,68 @@
+"""
+Equivalence test for the TikTok link scanners
+Checks that the hyperscan scanner finds the same links as the re scanner
+"""
+
+import importlib.util
+import random
+import unittest
+
+from src.utils import utils
+
+# Fragments that build link-like (and almost link-like) page sources
+LINK_FRAGMENTS = [
+    'https://www.tiktok.com/@', '/video/', 'https://vm.tiktok.com/',
+    'https://www.tiktok.com/t/', '"url":"', '"shareUrl":"', 'href="', '"', '/',
+]
+TEXT_FRAGMENTS = ['a', 'Z', '0', '.', '-', '_', 'ü', 'é', '字', '🙂', ' ', '<div>']
+
+
+def scan_with_re(page_source):
+    """Links found by the re scanner, in page order"""
+    return [utils._link_from_match(match) for match in utils._TIKTOK_LINKS.finditer(page_source)]
+
+
+def random_page(rng):
+    """Build a random page source mixing link fragments, text and digits"""
+    parts = []
+    for _ in range(rng.randint(1, 40)):
+        if rng.random() < 0.4:
+            parts.append(rng.choice(LINK_FRAGMENTS))
+        else:
+            parts.append(''.join(rng.choice(TEXT_FRAGMENTS) for _ in range(rng.randint(0, 4))))
+        if rng.random() < 0.3:
+            parts.append(str(rng.randint(0, 10**6)))
+    return ''.join(parts)
+
+
+@unittest.skipUnless(importlib.util.find_spec("hyperscan"), "hyperscan is not installed")
+class TestLinkScanners(unittest.TestCase):
+    """The hyperscan scanner must return exactly what the re scanner returns"""
+    
+    def setUp(self):
+        self.database = utils._hyperscan_database()
+        self.assertIsNotNone(self.database)
+    
+    def test_known_links(self):
+        page_source = (
+            '<a href="https://www.tiktok.com/@user.name/video/123">x</a>'
+            '{"url":"https://www.tiktok.com/@üser/video/456"}'
+            ' https://vm.tiktok.com/ZMabc/ https://www.tiktok.com/t/XYZ/ 字'
+        )
+        links = utils._scan_links_hyperscan(self.database, page_source)
+        self.assertEqual(links, scan_with_re(page_source))
+        self.assertIn('https://www.tiktok.com/@üser/video/456', links)
+    
+    def test_random_pages(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            page_source = random_page(rng)
+            self.assertEqual(
+                utils._scan_links_hyperscan(self.database, page_source),
+                scan_with_re(page_source),
+                page_source
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()